@@ -13,6 +13,27 @@ import pulumi
 from pulumi import ResourceOptions
 from pulumi_aws import iam
 
+# Accepted argument names: snake_case key -> camelCase alias
+_ARG_ALIASES = {
+    "role_name": "roleName",
+    "tags_additional": "tagsAdditional",
+    "repositories": "repositories",
+    "branches": "branches",
+    "environments": "environments",
+    "thumbprint": "thumbprint",
+    "policy_arns": "policyArns",
+    "inline_policies": "inlinePolicies",
+}
+
+
+def _is_computed(value) -> bool:
+    """Return True if a list arg is an Output or contains Output elements."""
+    if isinstance(value, pulumi.Output):
+        return True
+    return isinstance(value, list) and any(
+        isinstance(item, pulumi.Output) for item in value
+    )
+
 
 class GithuboidcArgs(TypedDict, total=False):
     """Arguments for creating a GitHub Actions OIDC provider and IAM role.
@@ -78,22 +99,23 @@ class Githuboidc(pulumi.ComponentResource):
         """
         super().__init__('githuboidc:index:Githuboidc', name, {}, opts)
 
-        # Helper to read snake_case or camelCase keys
-        def pick(d: dict, snake: str, camel: str):
-            """Get value from dict supporting both snake_case and camelCase."""
-            return d.get(snake, d.get(camel))
+        # Normalize args once, supporting both snake_case and camelCase keys
+        resolved = {
+            snake: args.get(snake, args.get(camel))
+            for snake, camel in _ARG_ALIASES.items()
+        }
 
-        # Get required parameters (support both snake_case and camelCase)
-        role_name = pick(args, "role_name", "roleName")
-        tags_additional = pick(args, "tags_additional", "tagsAdditional") or {}
-        repositories = pick(args, "repositories", "repositories") or []
+        # Get required parameters
+        role_name = resolved["role_name"]
+        tags_additional = resolved["tags_additional"] or {}
+        repositories = resolved["repositories"] or []
 
         # Get optional parameters with defaults
-        branches = pick(args, "branches", "branches") or ["*"]
-        environments = pick(args, "environments", "environments")
+        branches = resolved["branches"] or ["*"]
+        environments = resolved["environments"]
 
         # Get thumbprint (required parameter)
-        thumbprint = pick(args, "thumbprint", "thumbprint")
+        thumbprint = resolved["thumbprint"]
 
         # GitHub OIDC provider URL (fixed for all GitHub Actions)
         github_oidc_url = "https://token.actions.githubusercontent.com"
@@ -101,6 +123,10 @@ class Githuboidc(pulumi.ComponentResource):
         # GitHub OIDC audience for AWS
         github_audience = "sts.amazonaws.com"
 
+        # Options shared by every child resource; Pulumi copies opts per
+        # resource, so a single instance can be reused safely
+        child_opts = ResourceOptions(parent=self)
+
         # Create the OIDC Identity Provider
         provider_name = f"{role_name}-oidc-provider" if role_name else (
             "github-actions-oidc-provider"
@@ -116,69 +142,84 @@ class Githuboidc(pulumi.ComponentResource):
             client_id_lists=[github_audience],
             thumbprint_lists=[thumbprint],
             tags=oidc_tags,
-            opts=ResourceOptions(parent=self),
+            opts=child_opts,
         )
 
-        # Build the assume role policy document
-        def create_assume_role_policy(inputs) -> str:
-            """Create the IAM trust policy for GitHub OIDC.
+        # Build the subject patterns for repository access
+        def create_sub_values(repos, branch_list, env_list) -> list[str]:
+            """Create the token subject patterns allowed to assume the role.
 
             Args:
-                inputs: Tuple of (provider_arn, repos, branch_list, env_list).
+                repos: List of "owner/repo" repositories.
+                branch_list: List of branch patterns ("*" for all branches).
+                env_list: Optional list of GitHub environment names.
 
             Returns:
-                JSON string of the trust policy document.
+                List of subject patterns for the StringLike condition.
             """
-            import json
-            provider_arn, repos, branch_list, env_list = inputs
-
-            # Create subject patterns for repository access
             # Format: repo:owner/repo:ref:refs/heads/branch or
-            # repo:owner/repo:* for all refs
-            sub_values = []
-            for repo in repos:
-                if branch_list and "*" not in branch_list:
-                    # Specific branch restrictions
-                    for branch in branch_list:
-                        sub_values.append(
-                            f"repo:{repo}:ref:refs/heads/{branch}"
-                        )
-                elif env_list:
-                    # Environment restrictions
-                    for env in env_list:
-                        sub_values.append(f"repo:{repo}:environment:{env}")
-                else:
-                    # All branches/refs allowed
-                    sub_values.append(f"repo:{repo}:*")
-
-            # Use StringLike for wildcard patterns
-            policy = {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Principal": {"Federated": provider_arn},
-                        "Action": "sts:AssumeRoleWithWebIdentity",
-                        "Condition": {
-                            "StringEquals": {
-                                "token.actions.githubusercontent.com:aud": (
-                                    github_audience
-                                )
-                            },
-                            "StringLike": {
-                                "token.actions.githubusercontent.com:sub": (
-                                    sub_values
-                                )
-                            },
+            # repo:owner/repo:* for all refs. The restriction type is the
+            # same for every repo, so it is decided once outside the loops.
+            if branch_list and "*" not in branch_list:
+                # Specific branch restrictions
+                return [
+                    f"repo:{repo}:ref:refs/heads/{branch}"
+                    for repo in repos
+                    for branch in branch_list
+                ]
+            if env_list:
+                # Environment restrictions
+                return [
+                    f"repo:{repo}:environment:{env}"
+                    for repo in repos
+                    for env in env_list
+                ]
+            # All branches/refs allowed
+            return [f"repo:{repo}:*" for repo in repos]
+
+        # Compute the subject patterns up front when the repo, branch and
+        # environment lists are plain values from the args; only resolve
+        # them asynchronously when a caller passes a computed list or a
+        # list with computed elements.
+        if any(
+            _is_computed(value)
+            for value in (repositories, branches, environments)
+        ):
+            sub_values = pulumi.Output.all(
+                repositories, branches, environments
+            ).apply(lambda inputs: create_sub_values(*inputs))
+        else:
+            sub_values = create_sub_values(
+                repositories, branches, environments
+            )
+
+        # Build the assume role policy document. It is passed to the role
+        # as a structured document rather than a JSON string: the engine
+        # resolves the nested provider ARN Output and the AWS provider
+        # serializes the document, so no apply or json.dumps is needed.
+        # Use StringLike for wildcard patterns.
+        assume_role_policy = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Principal": {"Federated": oidc_provider.arn},
+                    "Action": "sts:AssumeRoleWithWebIdentity",
+                    "Condition": {
+                        "StringEquals": {
+                            "token.actions.githubusercontent.com:aud": (
+                                github_audience
+                            )
                         },
-                    }
-                ],
-            }
-            return json.dumps(policy)
-
-        assume_role_policy = pulumi.Output.all(
-            oidc_provider.arn, repositories, branches, environments
-        ).apply(create_assume_role_policy)
+                        "StringLike": {
+                            "token.actions.githubusercontent.com:sub": (
+                                sub_values
+                            )
+                        },
+                    },
+                }
+            ],
+        }
 
         # Create the IAM role
         role_tags = {
@@ -191,33 +232,35 @@ class Githuboidc(pulumi.ComponentResource):
             name=role_name,
             assume_role_policy=assume_role_policy,
             tags=role_tags,
-            opts=ResourceOptions(parent=self),
+            opts=child_opts,
         )
 
         # Attach managed policies if provided
-        policy_arns = pick(args, "policy_arns", "policyArns") or []
-        for i, policy_arn in enumerate(policy_arns):
-            if policy_arn:  # Skip None or empty values
-                iam.RolePolicyAttachment(
-                    f"github-role-policy-attachment-{i}",
-                    role=role.name,
-                    policy_arn=policy_arn,
-                    opts=ResourceOptions(parent=self),
-                )
+        policy_arns = resolved["policy_arns"]
+        if policy_arns:
+            for i, policy_arn in enumerate(policy_arns):
+                if policy_arn:  # Skip None or empty values
+                    iam.RolePolicyAttachment(
+                        f"github-role-policy-attachment-{i}",
+                        role=role.name,
+                        policy_arn=policy_arn,
+                        opts=child_opts,
+                    )
 
         # Attach inline policies if provided
-        inline_policies = pick(args, "inline_policies", "inlinePolicies") or []
-        for i, policy in enumerate(inline_policies):
-            if policy:  # Skip None or empty values
-                # Use a safe resource name, fallback to indexed name
-                resource_name = f"inline-policy-{i}"
-                iam.RolePolicy(
-                    resource_name,
-                    name=policy.get("name"),
-                    role=role.name,
-                    policy=policy.get("policy"),
-                    opts=ResourceOptions(parent=self),
-                )
+        inline_policies = resolved["inline_policies"]
+        if inline_policies:
+            for i, policy in enumerate(inline_policies):
+                if policy:  # Skip None or empty values
+                    # Use a safe resource name, fallback to indexed name
+                    resource_name = f"inline-policy-{i}"
+                    iam.RolePolicy(
+                        resource_name,
+                        name=policy.get("name"),
+                        role=role.name,
+                        policy=policy.get("policy"),
+                        opts=child_opts,
+                    )
 
         self.oidc_provider_arn = oidc_provider.arn
         self.role_arn = role.arn
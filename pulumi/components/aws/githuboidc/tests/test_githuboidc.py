@@ -5,10 +5,20 @@ These tests use Pulumi's unit testing framework to validate the behavior
 of the GitHub OIDC component without creating actual AWS resources.
 """
 
+import json
+import os
+import sys
 import unittest
 from typing import Any
 import pulumi
 
+# Make the component importable once for the whole module
+_COMPONENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _COMPONENT_DIR not in sys.path:
+    sys.path.insert(0, _COMPONENT_DIR)
+
+from githuboidc import Githuboidc  # noqa: E402
+
 
 class MyMocks(pulumi.runtime.Mocks):
     """
@@ -18,6 +28,10 @@ class MyMocks(pulumi.runtime.Mocks):
     allowing us to test the logic of our Pulumi components.
     """
 
+    def __init__(self) -> None:
+        """Record the trust policy of each mocked role by role name."""
+        self.trust_policies: dict[str, dict[str, Any]] = {}
+
     def new_resource(
         self, args: pulumi.runtime.MockResourceArgs
     ) -> tuple[str, dict[str, Any]]:
@@ -43,6 +57,11 @@ class MyMocks(pulumi.runtime.Mocks):
                 f"arn:aws:iam::123456789012:role/{outputs.get('name', args.name)}"
             )
             outputs["name"] = outputs.get("name", args.name)
+            # The provider stores a structured trust policy as JSON
+            policy = outputs.get("assumeRolePolicy")
+            if isinstance(policy, dict):
+                self.trust_policies[outputs["name"]] = policy
+                outputs["assumeRolePolicy"] = json.dumps(policy)
 
         # Mock IAM Role Policy Attachment
         elif args.typ == "aws:iam/rolePolicyAttachment:RolePolicyAttachment":
@@ -64,26 +83,44 @@ class MyMocks(pulumi.runtime.Mocks):
 
 
 # Set the mocks for all tests in this module
-pulumi.runtime.set_mocks(MyMocks())
+mocks = MyMocks()
+pulumi.runtime.set_mocks(mocks)
+
+# ARN the mocked OIDC provider resolves to
+MOCK_PROVIDER_ARN = (
+    "arn:aws:iam::123456789012:oidc-provider/"
+    "token.actions.githubusercontent.com"
+)
 
 
 class TestGithuboidc(unittest.TestCase):
     """Test cases for the GitHub OIDC component."""
 
+    def assert_trust_policy(self, role_name: str, sub_values: list[str]):
+        """
+        Assert the mocked role's trust policy federates the OIDC provider
+        and allows exactly the given token subject patterns.
+        """
+        policy = mocks.trust_policies[role_name]
+        statement, = policy["Statement"]
+        self.assertEqual(
+            statement["Principal"]["Federated"], MOCK_PROVIDER_ARN
+        )
+        self.assertEqual(statement["Action"], "sts:AssumeRoleWithWebIdentity")
+        self.assertEqual(
+            statement["Condition"]["StringEquals"],
+            {"token.actions.githubusercontent.com:aud": "sts.amazonaws.com"},
+        )
+        self.assertEqual(
+            statement["Condition"]["StringLike"],
+            {"token.actions.githubusercontent.com:sub": sub_values},
+        )
+
     @pulumi.runtime.test
     def test_basic_creation(self):
         """
         Test basic GitHub OIDC component creation with required parameters.
         """
-        import sys
-        import os
-
-        # Add the parent directory to the path
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from githuboidc import Githuboidc
-
         # Define test arguments
         args = {
             "roleName": "test-github-actions-role",
@@ -117,14 +154,6 @@ class TestGithuboidc(unittest.TestCase):
         """
         Test component with wildcard branch access (all branches).
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from githuboidc import Githuboidc
-
         args = {
             "roleName": "test-all-branches-role",
             "repositories": ["malloryai/infrastructure"],
@@ -139,6 +168,10 @@ class TestGithuboidc(unittest.TestCase):
             role_arn, role_name = outputs
             self.assertIsNotNone(role_arn)
             self.assertIsNotNone(role_name)
+            self.assert_trust_policy(
+                "test-all-branches-role",
+                ["repo:malloryai/infrastructure:*"],
+            )
 
         return pulumi.Output.all(
             component.role_arn,
@@ -150,14 +183,6 @@ class TestGithuboidc(unittest.TestCase):
         """
         Test component with specific branch restrictions.
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from githuboidc import Githuboidc
-
         args = {
             "roleName": "test-specific-branches-role",
             "repositories": ["malloryai/infrastructure"],
@@ -171,6 +196,13 @@ class TestGithuboidc(unittest.TestCase):
         def check_outputs(outputs):
             role_arn, = outputs
             self.assertIsNotNone(role_arn)
+            self.assert_trust_policy(
+                "test-specific-branches-role",
+                [
+                    "repo:malloryai/infrastructure:ref:refs/heads/main",
+                    "repo:malloryai/infrastructure:ref:refs/heads/develop",
+                ],
+            )
 
         return pulumi.Output.all(
             component.role_arn,
@@ -181,14 +213,6 @@ class TestGithuboidc(unittest.TestCase):
         """
         Test component with GitHub environment restrictions.
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from githuboidc import Githuboidc
-
         args = {
             "roleName": "test-environments-role",
             "repositories": ["malloryai/infrastructure"],
@@ -202,24 +226,50 @@ class TestGithuboidc(unittest.TestCase):
         def check_outputs(outputs):
             role_arn, = outputs
             self.assertIsNotNone(role_arn)
+            self.assert_trust_policy(
+                "test-environments-role",
+                [
+                    "repo:malloryai/infrastructure:environment:production",
+                    "repo:malloryai/infrastructure:environment:staging",
+                ],
+            )
 
         return pulumi.Output.all(
             component.role_arn,
         ).apply(lambda args: check_outputs(args))
 
     @pulumi.runtime.test
-    def test_with_policy_arns(self):
+    def test_with_output_repository(self):
         """
-        Test component with managed policy attachments.
+        Test component with a repository list holding computed elements.
         """
-        import sys
-        import os
+        args = {
+            "roleName": "test-output-repo-role",
+            "repositories": [pulumi.Output.from_input("malloryai/core")],
+            "branches": ["main"],
+            "thumbprint": "2b18947a6a9fc7764fd8b5fb18a863b0c6dac24f",
+            "tagsAdditional": {},
+        }
 
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from githuboidc import Githuboidc
+        component = Githuboidc("test-output-repo", args)
+
+        def check_outputs(outputs):
+            role_arn, = outputs
+            self.assertIsNotNone(role_arn)
+            self.assert_trust_policy(
+                "test-output-repo-role",
+                ["repo:malloryai/core:ref:refs/heads/main"],
+            )
 
+        return pulumi.Output.all(
+            component.role_arn,
+        ).apply(lambda args: check_outputs(args))
+
+    @pulumi.runtime.test
+    def test_with_policy_arns(self):
+        """
+        Test component with managed policy attachments.
+        """
         args = {
             "roleName": "test-policy-arns-role",
             "repositories": ["malloryai/infrastructure"],
@@ -248,15 +298,6 @@ class TestGithuboidc(unittest.TestCase):
         """
         Test component with inline policy attachments.
         """
-        import sys
-        import os
-        import json
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from githuboidc import Githuboidc
-
         inline_policy = json.dumps({
             "Version": "2012-10-17",
             "Statement": [{
@@ -292,14 +333,6 @@ class TestGithuboidc(unittest.TestCase):
         """
         Test component with multiple repository access.
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from githuboidc import Githuboidc
-
         args = {
             "roleName": "test-multi-repo-role",
             "repositories": [
@@ -326,14 +359,6 @@ class TestGithuboidc(unittest.TestCase):
         """
         Test component with snake_case parameter names.
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from githuboidc import Githuboidc
-
         args = {
             "role_name": "test-snake-case-role",
             "repositories": ["malloryai/infrastructure"],
@@ -363,14 +388,6 @@ class TestGithuboidc(unittest.TestCase):
         """
         Test that tags are correctly applied to resources.
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from githuboidc import Githuboidc
-
         args = {
             "roleName": "test-tags-role",
             "repositories": ["malloryai/infrastructure"],
@@ -5,9 +5,65 @@ These tests use Pulumi's unit testing framework to validate the behavior
 of the VPC component without creating actual AWS resources.
 """
 
+import os
+import sys
 import unittest
-from typing import Any
+from typing import Any, Optional
 import pulumi
+import pytest
+
+# Make the component importable once for the whole module
+_COMPONENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _COMPONENT_DIR not in sys.path:
+    sys.path.insert(0, _COMPONENT_DIR)
+
+from vpc import Vpc, _resolve_args  # noqa: E402
+
+
+_ARN_PREFIX = "arn:aws:ec2:region:account"
+
+
+def _mock_ids(id_prefix: str, arn_type: Optional[str] = None):
+    """
+    Build a mock handler that sets a resource's id, and its ARN if given.
+
+    The handler formats the id once and reuses it for the ARN.
+    """
+
+    def handler(name: str, outputs: dict[str, Any]) -> None:
+        resource_id = f"{id_prefix}-{name}"
+        outputs["id"] = resource_id
+        if arn_type:
+            outputs["arn"] = f"{_ARN_PREFIX}:{arn_type}/{resource_id}"
+
+    return handler
+
+
+def _mock_eip(name: str, outputs: dict[str, Any]) -> None:
+    """Mock an Elastic IP, which also gets a public IP address."""
+    outputs["id"] = f"eip-{name}"
+    outputs["public_ip"] = "1.2.3.4"
+
+
+# Mock handlers keyed by resource type, so each mocked resource is a
+# single dict lookup instead of a walk through an if/elif chain
+_MOCK_HANDLERS = {
+    "aws:ec2/vpc:Vpc": _mock_ids("vpc", "vpc"),
+    "aws:ec2/subnet:Subnet": _mock_ids("subnet", "subnet"),
+    "aws:ec2/internetGateway:InternetGateway": _mock_ids(
+        "igw", "internet-gateway"
+    ),
+    "aws:ec2/natGateway:NatGateway": _mock_ids("nat"),
+    "aws:ec2/eip:Eip": _mock_eip,
+    "aws:ec2/routeTable:RouteTable": _mock_ids("rtb"),
+    "aws:ec2/route:Route": _mock_ids("route"),
+    "aws:ec2/routeTableAssociation:RouteTableAssociation": _mock_ids(
+        "rtbassoc"
+    ),
+    "aws:ec2/securityGroup:SecurityGroup": _mock_ids(
+        "sg", "security-group"
+    ),
+}
 
 
 class MyMocks(pulumi.runtime.Mocks):
@@ -18,6 +74,10 @@ class MyMocks(pulumi.runtime.Mocks):
     allowing us to test the logic of our Pulumi components.
     """
 
+    def __init__(self) -> None:
+        """Initialize the record of mocked resources, keyed by name."""
+        self.resources: dict[str, dict[str, Any]] = {}
+
     def new_resource(
         self, args: pulumi.runtime.MockResourceArgs
     ) -> tuple[str, dict[str, Any]]:
@@ -28,47 +88,11 @@ class MyMocks(pulumi.runtime.Mocks):
         """
         outputs = args.inputs
 
-        # Mock VPC
-        if args.typ == "aws:ec2/vpc:Vpc":
-            outputs["id"] = f"vpc-{args.name}"
-            outputs["arn"] = f"arn:aws:ec2:region:account:vpc/{outputs['id']}"
-
-        # Mock Subnet
-        elif args.typ == "aws:ec2/subnet:Subnet":
-            outputs["id"] = f"subnet-{args.name}"
-            outputs["arn"] = f"arn:aws:ec2:region:account:subnet/{outputs['id']}"
-
-        # Mock Internet Gateway
-        elif args.typ == "aws:ec2/internetGateway:InternetGateway":
-            outputs["id"] = f"igw-{args.name}"
-            outputs["arn"] = f"arn:aws:ec2:region:account:internet-gateway/{outputs['id']}"
-
-        # Mock NAT Gateway
-        elif args.typ == "aws:ec2/natGateway:NatGateway":
-            outputs["id"] = f"nat-{args.name}"
-
-        # Mock Elastic IP
-        elif args.typ == "aws:ec2/eip:Eip":
-            outputs["id"] = f"eip-{args.name}"
-            outputs["public_ip"] = "1.2.3.4"
-
-        # Mock Route Table
-        elif args.typ == "aws:ec2/routeTable:RouteTable":
-            outputs["id"] = f"rtb-{args.name}"
-
-        # Mock Route
-        elif args.typ == "aws:ec2/route:Route":
-            outputs["id"] = f"route-{args.name}"
-
-        # Mock Route Table Association
-        elif args.typ == "aws:ec2/routeTableAssociation:RouteTableAssociation":
-            outputs["id"] = f"rtbassoc-{args.name}"
-
-        # Mock Security Group
-        elif args.typ == "aws:ec2/securityGroup:SecurityGroup":
-            outputs["id"] = f"sg-{args.name}"
-            outputs["arn"] = f"arn:aws:ec2:region:account:security-group/{outputs['id']}"
+        handler = _MOCK_HANDLERS.get(args.typ)
+        if handler:
+            handler(args.name, outputs)
 
+        self.resources[args.name] = outputs
         return outputs.get("id", args.name), outputs
 
     def call(self, args: pulumi.runtime.MockCallArgs) -> dict[str, Any]:
@@ -80,8 +104,45 @@ class MyMocks(pulumi.runtime.Mocks):
         return {}
 
 
-# Set the mocks for all tests in this module
-pulumi.runtime.set_mocks(MyMocks())
+@pytest.fixture(autouse=True)
+def pulumi_mocks(request):
+    """
+    Set fresh mocks before each test.
+
+    Each test (and each pytest-xdist worker) gets its own mock registry,
+    so tests do not depend on module import order or shared state. The
+    mocks are exposed to test methods as `self.mocks`.
+    """
+    mocks = MyMocks()
+    pulumi.runtime.set_mocks(mocks)
+    if request.instance is not None:
+        request.instance.mocks = mocks
+
+
+_AZS_WEST = ["us-west-2a", "us-west-2b", "us-west-2c"]
+
+
+def _make_args(cidr_prefix: int, **overrides: Any) -> dict[str, Any]:
+    """
+    Build camelCase VPC args in 10.<cidr_prefix>.0.0/16.
+
+    Creates three public (.1-.3) and three private (.11-.13) /24 subnets
+    across _AZS_WEST, tagged Environment=test. Keyword arguments replace
+    individual args.
+    """
+    args = {
+        "vpcCidr": f"10.{cidr_prefix}.0.0/16",
+        "publicSubnetCidrs": [
+            f"10.{cidr_prefix}.{i}.0/24" for i in (1, 2, 3)
+        ],
+        "privateSubnetCidrs": [
+            f"10.{cidr_prefix}.{i}.0/24" for i in (11, 12, 13)
+        ],
+        "availabilityZones": _AZS_WEST,
+        "tagsAdditional": {"Environment": "test"},
+    }
+    args.update(overrides)
+    return args
 
 
 class TestVpc(unittest.TestCase):
@@ -92,36 +153,8 @@ class TestVpc(unittest.TestCase):
         """
         Test basic VPC creation without NAT Gateways.
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from vpc import Vpc
-
         # Define test arguments
-        args = {
-            "vpcCidr": "10.0.0.0/16",
-            "publicSubnetCidrs": [
-                "10.0.1.0/24",
-                "10.0.2.0/24",
-                "10.0.3.0/24",
-            ],
-            "privateSubnetCidrs": [
-                "10.0.11.0/24",
-                "10.0.12.0/24",
-                "10.0.13.0/24",
-            ],
-            "availabilityZones": [
-                "us-west-2a",
-                "us-west-2b",
-                "us-west-2c",
-            ],
-            "tagsAdditional": {
-                "Environment": "test",
-            },
-        }
+        args = _make_args(0)
 
         # Create the component
         component = Vpc("test-vpc", args)
@@ -157,36 +190,11 @@ class TestVpc(unittest.TestCase):
         """
         Test VPC creation with NAT Gateways enabled.
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        args = _make_args(
+            1,
+            enableNatGateway=True,
+            tagsAdditional={"Environment": "staging"},
         )
-        from vpc import Vpc
-
-        args = {
-            "vpcCidr": "10.1.0.0/16",
-            "publicSubnetCidrs": [
-                "10.1.1.0/24",
-                "10.1.2.0/24",
-                "10.1.3.0/24",
-            ],
-            "privateSubnetCidrs": [
-                "10.1.11.0/24",
-                "10.1.12.0/24",
-                "10.1.13.0/24",
-            ],
-            "availabilityZones": [
-                "us-west-2a",
-                "us-west-2b",
-                "us-west-2c",
-            ],
-            "enableNatGateway": True,
-            "tagsAdditional": {
-                "Environment": "staging",
-            },
-        }
 
         component = Vpc("test-vpc-nat", args)
 
@@ -207,34 +215,12 @@ class TestVpc(unittest.TestCase):
         """
         Test VPC creation with custom VPC name.
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        args = _make_args(
+            2,
+            availabilityZones=["us-east-1a", "us-east-1b", "us-east-1c"],
+            vpcName="custom-application-vpc",
+            tagsAdditional={},
         )
-        from vpc import Vpc
-
-        args = {
-            "vpcCidr": "10.2.0.0/16",
-            "publicSubnetCidrs": [
-                "10.2.1.0/24",
-                "10.2.2.0/24",
-                "10.2.3.0/24",
-            ],
-            "privateSubnetCidrs": [
-                "10.2.11.0/24",
-                "10.2.12.0/24",
-                "10.2.13.0/24",
-            ],
-            "availabilityZones": [
-                "us-east-1a",
-                "us-east-1b",
-                "us-east-1c",
-            ],
-            "vpcName": "custom-application-vpc",
-            "tagsAdditional": {},
-        }
 
         component = Vpc("test-custom-name", args)
 
@@ -251,14 +237,6 @@ class TestVpc(unittest.TestCase):
         """
         Test VPC creation with snake_case parameter names.
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from vpc import Vpc
-
         args = {
             "vpc_cidr": "10.3.0.0/16",
             "public_subnet_cidrs": [
@@ -302,38 +280,15 @@ class TestVpc(unittest.TestCase):
         """
         Test that tags are correctly applied to resources.
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from vpc import Vpc
-
-        args = {
-            "vpcCidr": "10.4.0.0/16",
-            "publicSubnetCidrs": [
-                "10.4.1.0/24",
-                "10.4.2.0/24",
-                "10.4.3.0/24",
-            ],
-            "privateSubnetCidrs": [
-                "10.4.11.0/24",
-                "10.4.12.0/24",
-                "10.4.13.0/24",
-            ],
-            "availabilityZones": [
-                "us-west-2a",
-                "us-west-2b",
-                "us-west-2c",
-            ],
-            "tagsAdditional": {
+        args = _make_args(
+            4,
+            tagsAdditional={
                 "Environment": "production",
                 "Project": "web-app",
                 "Team": "platform",
                 "CostCenter": "engineering",
             },
-        }
+        )
 
         component = Vpc("test-tags", args)
 
@@ -352,33 +307,7 @@ class TestVpc(unittest.TestCase):
         """
         Test that all expected outputs are present.
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        from vpc import Vpc
-
-        args = {
-            "vpcCidr": "10.5.0.0/16",
-            "publicSubnetCidrs": [
-                "10.5.1.0/24",
-                "10.5.2.0/24",
-                "10.5.3.0/24",
-            ],
-            "privateSubnetCidrs": [
-                "10.5.11.0/24",
-                "10.5.12.0/24",
-                "10.5.13.0/24",
-            ],
-            "availabilityZones": [
-                "us-west-2a",
-                "us-west-2b",
-                "us-west-2c",
-            ],
-            "tagsAdditional": {},
-        }
+        args = _make_args(5, tagsAdditional={})
 
         component = Vpc("test-outputs", args)
 
@@ -396,32 +325,12 @@ class TestVpc(unittest.TestCase):
         """
         Test VPC creation with only 2 subnets instead of 3.
         """
-        import sys
-        import os
-
-        sys.path.insert(
-            0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        args = _make_args(
+            6,
+            publicSubnetCidrs=["10.6.1.0/24", "10.6.2.0/24"],
+            privateSubnetCidrs=["10.6.11.0/24", "10.6.12.0/24"],
+            availabilityZones=["us-west-2a", "us-west-2b"],
         )
-        from vpc import Vpc
-
-        args = {
-            "vpcCidr": "10.6.0.0/16",
-            "publicSubnetCidrs": [
-                "10.6.1.0/24",
-                "10.6.2.0/24",
-            ],
-            "privateSubnetCidrs": [
-                "10.6.11.0/24",
-                "10.6.12.0/24",
-            ],
-            "availabilityZones": [
-                "us-west-2a",
-                "us-west-2b",
-            ],
-            "tagsAdditional": {
-                "Environment": "test",
-            },
-        }
 
         component = Vpc("test-two-subnets", args)
 
@@ -438,6 +347,67 @@ class TestVpc(unittest.TestCase):
             component.private_subnet_ids,
         ).apply(lambda args: check_outputs(args))
 
+    @pulumi.runtime.test
+    def test_subnets_use_cidr_and_az_at_same_index(self):
+        """
+        Test that each subnet gets the CIDR and AZ at its own index.
+
+        Private subnet CIDRs are passed as an Output so both the direct
+        indexing and the apply path are covered.
+        """
+        args = _make_args(7, tagsAdditional={})
+        public_cidrs = args["publicSubnetCidrs"]
+        private_cidrs = args["privateSubnetCidrs"]
+        zones = args["availabilityZones"]
+        args["privateSubnetCidrs"] = pulumi.Output.from_input(private_cidrs)
+
+        component = Vpc("test-subnet-index", args)
+
+        def check_subnets(_):
+            resources = self.mocks.resources
+            for i, zone in enumerate(zones):
+                public = resources[f"test-subnet-index-public-subnet-{i+1}"]
+                private = resources[f"test-subnet-index-private-subnet-{i+1}"]
+                self.assertEqual(public["cidrBlock"], public_cidrs[i])
+                self.assertEqual(public["availabilityZone"], zone)
+                self.assertEqual(private["cidrBlock"], private_cidrs[i])
+                self.assertEqual(private["availabilityZone"], zone)
+
+        return pulumi.Output.all(
+            component.public_subnet_ids,
+            component.private_subnet_ids,
+        ).apply(check_subnets)
+
+    @pulumi.runtime.test
+    def test_mismatched_subnet_counts_raise(self):
+        """
+        Test that subnet and availability zone lists must be the same length.
+        """
+        args = _make_args(
+            8, availabilityZones=["us-west-2a", "us-west-2b"]
+        )
+
+        with self.assertRaises(ValueError):
+            Vpc("test-mismatched", args)
+
 
-if __name__ == "__main__":
-    unittest.main()
+class TestResolveArgs(unittest.TestCase):
+    """Test cases for VPC argument normalization."""
+
+    def test_camel_and_snake_case_keys(self):
+        """
+        Test that camelCase and snake_case keys resolve to snake_case.
+        """
+        resolved = _resolve_args({
+            "vpcCidr": "10.9.0.0/16",
+            "enable_nat_gateway": True,
+            "vpcName": "camel-vpc",
+            "vpc_name": "snake-vpc",
+        })
+
+        self.assertEqual(resolved["vpc_cidr"], "10.9.0.0/16")
+        self.assertTrue(resolved["enable_nat_gateway"])
+        # snake_case wins when both spellings are given
+        self.assertEqual(resolved["vpc_name"], "snake-vpc")
+        # Missing arguments resolve to None
+        self.assertIsNone(resolved["availability_zones"])
@@ -15,6 +15,53 @@ import pulumi
 from pulumi import ResourceOptions, Output
 from pulumi_aws import ec2
 
+# Accepted argument names: snake_case key -> camelCase alias
+_ARG_ALIASES = {
+    "vpc_cidr": "vpcCidr",
+    "public_subnet_cidrs": "publicSubnetCidrs",
+    "private_subnet_cidrs": "privateSubnetCidrs",
+    "availability_zones": "availabilityZones",
+    "tags_additional": "tagsAdditional",
+    "enable_nat_gateway": "enableNatGateway",
+    "vpc_name": "vpcName",
+}
+
+# Rules for the default security group. Plain dicts are accepted wherever
+# SecurityGroupIngressArgs/EgressArgs are, and are built once per module
+# instead of once per Vpc.
+_ALLOW_ALL_INGRESS = {
+    "protocol": "-1",
+    "from_port": 0,
+    "to_port": 0,
+    "cidr_blocks": ["0.0.0.0/0"],
+    "description": "Allow all inbound traffic",
+}
+_ALLOW_ALL_EGRESS = {
+    "protocol": "-1",
+    "from_port": 0,
+    "to_port": 0,
+    "cidr_blocks": ["0.0.0.0/0"],
+    "description": "Allow all outbound traffic",
+}
+
+
+def _resolve_args(args: dict) -> dict:
+    """Normalize VPC args to snake_case keys.
+
+    Each argument may be given in snake_case or camelCase; snake_case wins
+    when both are present. Missing arguments resolve to None.
+
+    Args:
+        args: The component arguments as passed to Vpc.
+
+    Returns:
+        Dict with every key in _ARG_ALIASES.
+    """
+    return {
+        snake: args.get(snake, args.get(camel))
+        for snake, camel in _ARG_ALIASES.items()
+    }
+
 
 class VpcArgs(TypedDict, total=False):
     """Arguments for creating a VPC with public and private subnets.
@@ -77,45 +124,53 @@ class Vpc(pulumi.ComponentResource):
         """
         super().__init__('vpc:index:Vpc', name, {}, opts)
 
-        # Helper to read snake_case or camelCase keys
-        def pick(d: dict, snake: str, camel: str, default=None):
-            """Get value from dict supporting both snake_case and camelCase."""
-            return d.get(snake, d.get(camel, default))
+        resolved = _resolve_args(args)
 
         # Get required parameters
-        vpc_cidr = pick(args, "vpc_cidr", "vpcCidr")
-        public_subnet_cidrs = pick(args, "public_subnet_cidrs", "publicSubnetCidrs")
-        private_subnet_cidrs = pick(args, "private_subnet_cidrs", "privateSubnetCidrs")
-        availability_zones = pick(args, "availability_zones", "availabilityZones")
-        tags_additional = pick(args, "tags_additional", "tagsAdditional") or {}
+        vpc_cidr = resolved["vpc_cidr"]
+        public_subnet_cidrs = resolved["public_subnet_cidrs"]
+        private_subnet_cidrs = resolved["private_subnet_cidrs"]
+        availability_zones = resolved["availability_zones"]
+        tags_additional = resolved["tags_additional"] or {}
 
         # Get optional parameters with defaults
-        enable_nat_gateway = pick(args, "enable_nat_gateway", "enableNatGateway", False)
-        vpc_name = pick(args, "vpc_name", "vpcName", name)
-
-        # Determine the number of subnets dynamically based on the input lists
-        # For static inputs (from YAML), we can determine this immediately
-        # For dynamic inputs (from other Pulumi resources), we default to the input length
-        def determine_subnet_count(cidrs):
-            """Determine subnet count from CIDR list."""
-            if isinstance(cidrs, list):
-                return len(cidrs)
-            return 3  # fallback default
-        
-        # Try to get the count directly if inputs are static (from YAML)
-        try:
-            if isinstance(public_subnet_cidrs, list):
-                num_subnets = len(public_subnet_cidrs)
-            else:
-                num_subnets = 3  # default
-        except:
-            num_subnets = 3  # default fallback
+        enable_nat_gateway = resolved["enable_nat_gateway"] or False
+        vpc_name = resolved["vpc_name"] or name
+
+        # Determine the number of subnets from the input lists. Static
+        # inputs (from YAML) are plain lists whose lengths must agree; an
+        # input computed by another Pulumi resource is an Output whose length
+        # is not known up front, so it is sized from the other lists, or
+        # three subnets are assumed when none of them is a plain list.
+        subnet_lists = {
+            "publicSubnetCidrs": public_subnet_cidrs,
+            "privateSubnetCidrs": private_subnet_cidrs,
+            "availabilityZones": availability_zones,
+        }
+        subnet_counts = {
+            arg_name: len(values)
+            for arg_name, values in subnet_lists.items()
+            if isinstance(values, list)
+        }
+        if len(set(subnet_counts.values())) > 1:
+            raise ValueError(
+                "publicSubnetCidrs, privateSubnetCidrs and availabilityZones "
+                f"must have the same number of entries, got {subnet_counts}"
+            )
+        num_subnets = next(iter(subnet_counts.values()), 3)
+
+        # Tags shared by every resource, resolved once
+        base_tags = dict(tags_additional)
+
+        def make_tags(resource_name: str, **extra_tags: str) -> dict:
+            """Build a resource's tags from its Name and the shared tags.
+
+            Values from tags_additional take precedence over Name and Type.
+            """
+            return {"Name": resource_name, **extra_tags, **base_tags}
 
         # Create VPC
-        vpc_tags = {
-            "Name": vpc_name,
-            **tags_additional,
-        }
+        vpc_tags = make_tags(vpc_name)
 
         vpc = ec2.Vpc(
             f"{name}-vpc",
@@ -127,10 +182,7 @@ class Vpc(pulumi.ComponentResource):
         )
 
         # Create Internet Gateway
-        igw_tags = {
-            "Name": f"{vpc_name}-igw",
-            **tags_additional,
-        }
+        igw_tags = make_tags(f"{vpc_name}-igw")
 
         internet_gateway = ec2.InternetGateway(
             f"{name}-igw",
@@ -139,48 +191,43 @@ class Vpc(pulumi.ComponentResource):
             opts=ResourceOptions(parent=self),
         )
 
-        # Helper functions for extracting values from lists
-        def get_az(zones, idx):
-            """Extract availability zone at index from list."""
-            if isinstance(zones, list):
-                return zones[idx] if idx < len(zones) else zones[0]
-            return zones
-
-        def get_cidr(cidrs, idx):
-            """Extract CIDR block at index from list."""
-            if isinstance(cidrs, list):
-                return cidrs[idx] if idx < len(cidrs) else cidrs[0]
-            return cidrs
-
-        # Create public subnets
-        public_subnets = []
-        for i in range(num_subnets):
-            subnet_tags = {
-                "Name": f"{vpc_name}-public-subnet-{i+1}",
-                "Type": "public",
-                **tags_additional,
-            }
-
-            subnet = ec2.Subnet(
-                f"{name}-public-subnet-{i+1}",
+        # Helper for extracting values from the subnet/AZ lists. The lists
+        # are plain values when they come from YAML, so they are indexed
+        # directly; an apply is only needed when a caller passes an Output.
+        def get_item(values, idx):
+            """Extract the value at index from a list or Output of a list."""
+            if isinstance(values, Output):
+                return values.apply(lambda items: items[idx])
+            return values[idx]
+
+        def create_subnet(kind: str, cidrs, idx: int) -> ec2.Subnet:
+            """Create the public or private subnet for the AZ at index idx.
+
+            Args:
+                kind: Either "public" or "private".
+                cidrs: The CIDR list for this kind of subnet.
+                idx: Index into the CIDR and availability zone lists.
+            """
+            return ec2.Subnet(
+                f"{name}-{kind}-subnet-{idx+1}",
                 vpc_id=vpc.id,
-                cidr_block=Output.from_input(public_subnet_cidrs).apply(
-                    lambda cidrs, idx=i: get_cidr(cidrs, idx)
+                cidr_block=get_item(cidrs, idx),
+                availability_zone=get_item(availability_zones, idx),
+                map_public_ip_on_launch=kind == "public",
+                tags=make_tags(
+                    f"{vpc_name}-{kind}-subnet-{idx+1}", Type=kind
                 ),
-                availability_zone=Output.from_input(availability_zones).apply(
-                    lambda zones, idx=i: get_az(zones, idx)
-                ),
-                map_public_ip_on_launch=True,
-                tags=subnet_tags,
                 opts=ResourceOptions(parent=self),
             )
-            public_subnets.append(subnet)
+
+        # Create public subnets
+        public_subnets = [
+            create_subnet("public", public_subnet_cidrs, i)
+            for i in range(num_subnets)
+        ]
 
         # Create public route table
-        public_rt_tags = {
-            "Name": f"{vpc_name}-public-rt",
-            **tags_additional,
-        }
+        public_rt_tags = make_tags(f"{vpc_name}-public-rt")
 
         public_route_table = ec2.RouteTable(
             f"{name}-public-rt",
@@ -208,96 +255,86 @@ class Vpc(pulumi.ComponentResource):
             )
 
         # Create private subnets
-        private_subnets = []
-        for i in range(num_subnets):
-            subnet_tags = {
-                "Name": f"{vpc_name}-private-subnet-{i+1}",
-                "Type": "private",
-                **tags_additional,
-            }
-
-            subnet = ec2.Subnet(
-                f"{name}-private-subnet-{i+1}",
-                vpc_id=vpc.id,
-                cidr_block=Output.from_input(private_subnet_cidrs).apply(
-                    lambda cidrs, idx=i: get_cidr(cidrs, idx)
-                ),
-                availability_zone=Output.from_input(availability_zones).apply(
-                    lambda zones, idx=i: get_az(zones, idx)
+        private_subnets = [
+            create_subnet("private", private_subnet_cidrs, i)
+            for i in range(num_subnets)
+        ]
+
+        def create_nat_routing(
+            idx: int, public_subnet: ec2.Subnet, private_subnet: ec2.Subnet
+        ) -> ec2.NatGateway:
+            """Route one private subnet through a NAT Gateway in its AZ.
+
+            Creates the Elastic IP and NAT Gateway in the public subnet, and
+            a private route table sending 0.0.0.0/0 to that NAT Gateway.
+
+            Resource registration is asynchronous and the engine schedules
+            creation by data dependencies, not by the order of these calls,
+            so e.g. every AZ's route table is created in parallel as soon as
+            the VPC exists; only the route waits on its NAT Gateway.
+            """
+            # Allocate Elastic IP for NAT Gateway
+            eip = ec2.Eip(
+                f"{name}-nat-eip-{idx+1}",
+                domain="vpc",
+                tags=make_tags(f"{vpc_name}-nat-eip-{idx+1}"),
+                opts=ResourceOptions(parent=self),
+            )
+
+            # Create NAT Gateway. A public NAT Gateway can only be created
+            # once the VPC has an Internet Gateway attached, and nothing in
+            # its inputs (subnet, EIP) references the IGW, so the ordering
+            # has to be explicit. It does not serialize the NAT Gateways
+            # against each other: they all start once the IGW exists.
+            nat_gateway = ec2.NatGateway(
+                f"{name}-nat-gw-{idx+1}",
+                subnet_id=public_subnet.id,
+                allocation_id=eip.id,
+                tags=make_tags(f"{vpc_name}-nat-gw-{idx+1}"),
+                opts=ResourceOptions(
+                    parent=self,
+                    depends_on=[internet_gateway],
                 ),
-                map_public_ip_on_launch=False,
-                tags=subnet_tags,
+            )
+
+            # Create private route table for this AZ
+            private_route_table = ec2.RouteTable(
+                f"{name}-private-rt-{idx+1}",
+                vpc_id=vpc.id,
+                tags=make_tags(f"{vpc_name}-private-rt-{idx+1}"),
                 opts=ResourceOptions(parent=self),
             )
-            private_subnets.append(subnet)
+
+            # Create route to NAT Gateway
+            ec2.Route(
+                f"{name}-private-route-{idx+1}",
+                route_table_id=private_route_table.id,
+                destination_cidr_block="0.0.0.0/0",
+                nat_gateway_id=nat_gateway.id,
+                opts=ResourceOptions(parent=self),
+            )
+
+            # Associate private subnet with route table
+            ec2.RouteTableAssociation(
+                f"{name}-private-rta-{idx+1}",
+                subnet_id=private_subnet.id,
+                route_table_id=private_route_table.id,
+                opts=ResourceOptions(parent=self),
+            )
+            return nat_gateway
 
         # Create NAT Gateways if enabled
         nat_gateways = []
         if enable_nat_gateway:
-            for i, public_subnet in enumerate(public_subnets):
-                # Allocate Elastic IP for NAT Gateway
-                eip_tags = {
-                    "Name": f"{vpc_name}-nat-eip-{i+1}",
-                    **tags_additional,
-                }
-
-                eip = ec2.Eip(
-                    f"{name}-nat-eip-{i+1}",
-                    domain="vpc",
-                    tags=eip_tags,
-                    opts=ResourceOptions(parent=self),
-                )
-
-                # Create NAT Gateway
-                nat_tags = {
-                    "Name": f"{vpc_name}-nat-gw-{i+1}",
-                    **tags_additional,
-                }
-
-                nat_gateway = ec2.NatGateway(
-                    f"{name}-nat-gw-{i+1}",
-                    subnet_id=public_subnet.id,
-                    allocation_id=eip.id,
-                    tags=nat_tags,
-                    opts=ResourceOptions(parent=self, depends_on=[internet_gateway]),
-                )
-                nat_gateways.append(nat_gateway)
-
-                # Create private route table for this AZ
-                private_rt_tags = {
-                    "Name": f"{vpc_name}-private-rt-{i+1}",
-                    **tags_additional,
-                }
-
-                private_route_table = ec2.RouteTable(
-                    f"{name}-private-rt-{i+1}",
-                    vpc_id=vpc.id,
-                    tags=private_rt_tags,
-                    opts=ResourceOptions(parent=self),
-                )
-
-                # Create route to NAT Gateway
-                ec2.Route(
-                    f"{name}-private-route-{i+1}",
-                    route_table_id=private_route_table.id,
-                    destination_cidr_block="0.0.0.0/0",
-                    nat_gateway_id=nat_gateway.id,
-                    opts=ResourceOptions(parent=self),
-                )
-
-                # Associate private subnet with route table
-                ec2.RouteTableAssociation(
-                    f"{name}-private-rta-{i+1}",
-                    subnet_id=private_subnets[i].id,
-                    route_table_id=private_route_table.id,
-                    opts=ResourceOptions(parent=self),
+            nat_gateways = [
+                create_nat_routing(i, public_subnet, private_subnet)
+                for i, (public_subnet, private_subnet) in enumerate(
+                    zip(public_subnets, private_subnets)
                 )
+            ]
         else:
             # Create a single private route table without NAT Gateway
-            private_rt_tags = {
-                "Name": f"{vpc_name}-private-rt",
-                **tags_additional,
-            }
+            private_rt_tags = make_tags(f"{vpc_name}-private-rt")
 
             private_route_table = ec2.RouteTable(
                 f"{name}-private-rt",
@@ -316,52 +353,41 @@ class Vpc(pulumi.ComponentResource):
                 )
 
         # Create default security group that allows all inbound and outbound traffic
-        sg_tags = {
-            "Name": f"{vpc_name}-default-sg",
-            **tags_additional,
-        }
+        sg_tags = make_tags(f"{vpc_name}-default-sg")
 
         default_security_group = ec2.SecurityGroup(
             f"{name}-default-sg",
             vpc_id=vpc.id,
             description="Default security group allowing all inbound and outbound traffic",
-            ingress=[
-                ec2.SecurityGroupIngressArgs(
-                    protocol="-1",
-                    from_port=0,
-                    to_port=0,
-                    cidr_blocks=["0.0.0.0/0"],
-                    description="Allow all inbound traffic",
-                )
-            ],
-            egress=[
-                ec2.SecurityGroupEgressArgs(
-                    protocol="-1",
-                    from_port=0,
-                    to_port=0,
-                    cidr_blocks=["0.0.0.0/0"],
-                    description="Allow all outbound traffic",
-                )
-            ],
+            ingress=[_ALLOW_ALL_INGRESS],
+            egress=[_ALLOW_ALL_EGRESS],
             tags=sg_tags,
             opts=ResourceOptions(parent=self),
         )
 
         # Set outputs
+        public_subnet_ids = [s.id for s in public_subnets]
+        private_subnet_ids = [s.id for s in private_subnets]
+        nat_gateway_ids = [ng.id for ng in nat_gateways]
+
         self.vpc_id = vpc.id
         self.vpc_arn = vpc.arn
-        self.public_subnet_ids = Output.all(*[s.id for s in public_subnets])
-        self.private_subnet_ids = Output.all(*[s.id for s in private_subnets])
+        self.public_subnet_ids = Output.all(*public_subnet_ids)
+        self.private_subnet_ids = Output.all(*private_subnet_ids)
         self.internet_gateway_id = internet_gateway.id
-        self.nat_gateway_ids = Output.all(*[ng.id for ng in nat_gateways]) if nat_gateways else Output.from_input([])
+        # Output.all() with no NAT Gateways already resolves to []
+        self.nat_gateway_ids = Output.all(*nat_gateway_ids)
         self.default_security_group_id = default_security_group.id
 
+        # register_outputs resolves Outputs nested in lists itself, so the
+        # resource ids are registered directly rather than waiting on the
+        # joined Output.all values above
         self.register_outputs({
-            'vpc_id': self.vpc_id,
-            'vpc_arn': self.vpc_arn,
-            'public_subnet_ids': self.public_subnet_ids,
-            'private_subnet_ids': self.private_subnet_ids,
-            'internet_gateway_id': self.internet_gateway_id,
-            'nat_gateway_ids': self.nat_gateway_ids,
-            'default_security_group_id': self.default_security_group_id,
+            'vpc_id': vpc.id,
+            'vpc_arn': vpc.arn,
+            'public_subnet_ids': public_subnet_ids,
+            'private_subnet_ids': private_subnet_ids,
+            'internet_gateway_id': internet_gateway.id,
+            'nat_gateway_ids': nat_gateway_ids,
+            'default_security_group_id': default_security_group.id,
         })